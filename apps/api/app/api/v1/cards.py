@@ -2,23 +2,25 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update as sql_update
 from app.database import get_db
-from app.models import KnowledgeCard, KnowledgeBase, UserCardProgress, User
+from app.models import KnowledgeCard, KnowledgeBase, User
 from app.schemas import (
     KnowledgeCardCreate,
     KnowledgeCardUpdate,
     KnowledgeCardResponse,
+    KnowledgeCardListAdapter,
     CardReviewSubmit,
     SuccessResponse,
 )
 from app.dependencies import get_current_user
-from datetime import datetime
+from app.services.srs import record_review
+import uuid
 
 router = APIRouter(prefix="/cards", tags=["cards"])
 
 
 @router.get("", response_model=SuccessResponse[list[KnowledgeCardResponse]])
 async def get_cards(
-    knowledge_base_id: str = Query(None),
+    knowledge_base_id: uuid.UUID | None = Query(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -33,7 +35,7 @@ async def get_cards(
 
     result = await db.execute(query)
     cards = result.scalars().all()
-    return SuccessResponse(data=[KnowledgeCardResponse.model_validate(c) for c in cards])
+    return SuccessResponse(data=KnowledgeCardListAdapter.validate_python(cards))
 
 
 @router.post("", response_model=SuccessResponse[KnowledgeCardResponse], status_code=status.HTTP_201_CREATED)
@@ -61,13 +63,12 @@ async def create_card(
     kb.card_count += 1
 
     await db.commit()
-    await db.refresh(card)
     return SuccessResponse(data=KnowledgeCardResponse.model_validate(card), message="卡片创建成功")
 
 
 @router.get("/{card_id}", response_model=SuccessResponse[KnowledgeCardResponse])
 async def get_card(
-    card_id: str,
+    card_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -89,7 +90,7 @@ async def get_card(
 
 @router.patch("/{card_id}", response_model=SuccessResponse[KnowledgeCardResponse])
 async def update_card(
-    card_id: str,
+    card_id: uuid.UUID,
     card_data: KnowledgeCardUpdate,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
@@ -111,14 +112,15 @@ async def update_card(
     for field, value in update_data.items():
         setattr(card, field, value)
 
-    await db.commit()
-    await db.refresh(card)
+    # Skip the write round-trip for an empty PATCH
+    if update_data:
+        await db.commit()
     return SuccessResponse(data=KnowledgeCardResponse.model_validate(card), message="卡片更新成功")
 
 
 @router.delete("/{card_id}", response_model=SuccessResponse[dict])
 async def delete_card(
-    card_id: str,
+    card_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -152,7 +154,7 @@ async def delete_card(
 
 @router.post("/{card_id}/review", response_model=SuccessResponse[dict])
 async def review_card(
-    card_id: str,
+    card_id: uuid.UUID,
     review_data: CardReviewSubmit,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
@@ -171,38 +173,7 @@ async def review_card(
     if not card:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="卡片不存在")
 
-    # Get or create progress
-    progress_result = await db.execute(
-        select(UserCardProgress).where(
-            UserCardProgress.user_id == current_user.id,
-            UserCardProgress.card_id == card_id
-        )
-    )
-    progress = progress_result.scalar_one_or_none()
-
-    if not progress:
-        progress = UserCardProgress(
-            user_id=current_user.id,
-            card_id=card_id
-        )
-        db.add(progress)
-
-    # Update progress
-    progress.review_count += 1
-    progress.last_reviewed_at = datetime.utcnow()
-
-    if review_data.is_correct:
-        progress.correct_count += 1
-        progress.weight = max(0.1, progress.weight * 0.8)  # Decrease weight for correct answers
-        if progress.correct_count >= 3:
-            progress.status = "mastered"
-        elif progress.review_count >= 1:
-            progress.status = "learning"
-    else:
-        progress.weight = min(2.0, progress.weight * 1.5)  # Increase weight for incorrect answers
-        progress.status = "learning"
-
-    await db.commit()
+    progress = await record_review(db, current_user.id, card.id, review_data.is_correct)
 
     return SuccessResponse(
         data={
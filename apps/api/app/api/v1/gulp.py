@@ -5,13 +5,16 @@ from app.database import get_db
 from app.models import Snapshot, KnowledgeCard, KnowledgeBase, UserCardProgress, User
 from app.schemas import (
     SnapshotResponse,
+    SnapshotListAdapter,
     KnowledgeCardResponse,
+    KnowledgeCardListAdapter,
     CardReviewSubmit,
     SuccessResponse,
 )
 from app.dependencies import get_current_user
-from datetime import datetime
+from app.services.srs import record_review
 import random
+import uuid
 
 router = APIRouter(prefix="/gulp", tags=["gulp"])
 
@@ -32,7 +35,7 @@ async def get_gulp_stream(
         .limit(50)
     )
     snapshots = result.scalars().all()
-    return SuccessResponse(data=[SnapshotResponse.model_validate(s) for s in snapshots])
+    return SuccessResponse(data=SnapshotListAdapter.validate_python(snapshots))
 
 
 @router.get("/quiz", response_model=SuccessResponse[list[KnowledgeCardResponse]])
@@ -42,47 +45,42 @@ async def get_quiz_cards(
 ):
     """获取待复习的测验卡片 - 基于权重的简单算法"""
 
-    # Get subscribed knowledge bases
-    kb_result = await db.execute(
-        select(KnowledgeBase.id)
+    # Get cards from subscribed knowledge bases with the user's progress in one query
+    cards_result = await db.execute(
+        select(KnowledgeCard, UserCardProgress.weight, UserCardProgress.status)
+        .join(KnowledgeBase)
+        .outerjoin(
+            UserCardProgress,
+            (UserCardProgress.card_id == KnowledgeCard.id)
+            & (UserCardProgress.user_id == current_user.id)
+        )
         .where(
             KnowledgeBase.user_id == current_user.id,
             KnowledgeBase.is_subscribed == True
         )
     )
-    kb_ids = [row[0] for row in kb_result.all()]
-
-    if not kb_ids:
-        return SuccessResponse(data=[], message="没有订阅的知识库")
-
-    # Get cards from subscribed knowledge bases
-    cards_result = await db.execute(
-        select(KnowledgeCard)
-        .where(KnowledgeCard.knowledge_base_id.in_(kb_ids))
-    )
-    all_cards = cards_result.scalars().all()
+    all_cards = cards_result.all()
 
     if not all_cards:
-        return SuccessResponse(data=[], message="没有可用的卡片")
-
-    # Get user progress for these cards
-    progress_result = await db.execute(
-        select(UserCardProgress)
-        .where(
-            UserCardProgress.user_id == current_user.id,
-            UserCardProgress.card_id.in_([c.id for c in all_cards])
+        # Only tell the two empty cases apart when there is nothing to show
+        kb_result = await db.execute(
+            select(KnowledgeBase.id)
+            .where(
+                KnowledgeBase.user_id == current_user.id,
+                KnowledgeBase.is_subscribed == True
+            )
+            .limit(1)
         )
-    )
-    progress_map = {p.card_id: p for p in progress_result.scalars().all()}
+        if kb_result.first() is None:
+            return SuccessResponse(data=[], message="没有订阅的知识库")
+        return SuccessResponse(data=[], message="没有可用的卡片")
 
     # Calculate weights and select cards
     weighted_cards = []
-    for card in all_cards:
-        progress = progress_map.get(card.id)
-        if progress:
-            weight = progress.weight
+    for card, weight, progress_status in all_cards:
+        if weight is not None:
             # Skip mastered cards with low probability
-            if progress.status == "mastered" and random.random() > 0.1:
+            if progress_status == "mastered" and random.random() > 0.1:
                 continue
         else:
             weight = 1.0  # New cards have default weight
@@ -106,14 +104,14 @@ async def get_quiz_cards(
     random.shuffle(selected_cards)
 
     return SuccessResponse(
-        data=[KnowledgeCardResponse.model_validate(c) for c in selected_cards],
+        data=KnowledgeCardListAdapter.validate_python(selected_cards),
         message=f"已为您准备 {len(selected_cards)} 张卡片"
     )
 
 
 @router.post("/quiz/{card_id}/submit", response_model=SuccessResponse[dict])
 async def submit_quiz(
-    card_id: str,
+    card_id: uuid.UUID,
     review_data: CardReviewSubmit,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
@@ -134,38 +132,7 @@ async def submit_quiz(
     if not card:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="卡片不存在")
 
-    # Get or create progress
-    progress_result = await db.execute(
-        select(UserCardProgress).where(
-            UserCardProgress.user_id == current_user.id,
-            UserCardProgress.card_id == card_id
-        )
-    )
-    progress = progress_result.scalar_one_or_none()
-
-    if not progress:
-        progress = UserCardProgress(
-            user_id=current_user.id,
-            card_id=card_id
-        )
-        db.add(progress)
-
-    # Update progress
-    progress.review_count += 1
-    progress.last_reviewed_at = datetime.utcnow()
-
-    if review_data.is_correct:
-        progress.correct_count += 1
-        progress.weight = max(0.1, progress.weight * 0.8)
-        if progress.correct_count >= 3:
-            progress.status = "mastered"
-        elif progress.review_count >= 1:
-            progress.status = "learning"
-    else:
-        progress.weight = min(2.0, progress.weight * 1.5)
-        progress.status = "learning"
-
-    await db.commit()
+    progress = await record_review(db, current_user.id, card.id, review_data.is_correct)
 
     return SuccessResponse(
         data={
@@ -7,10 +7,13 @@ from app.schemas import (
     KnowledgeBaseCreate,
     KnowledgeBaseUpdate,
     KnowledgeBaseResponse,
+    KnowledgeBaseListAdapter,
     KnowledgeCardResponse,
+    KnowledgeCardListAdapter,
     SuccessResponse,
 )
 from app.dependencies import get_current_user
+import uuid
 
 router = APIRouter(prefix="/knowledge-bases", tags=["knowledge-bases"])
 
@@ -26,7 +29,7 @@ async def get_knowledge_bases(
         .order_by(KnowledgeBase.created_at.desc())
     )
     kbs = result.scalars().all()
-    return SuccessResponse(data=[KnowledgeBaseResponse.model_validate(kb) for kb in kbs])
+    return SuccessResponse(data=KnowledgeBaseListAdapter.validate_python(kbs))
 
 
 @router.post("", response_model=SuccessResponse[KnowledgeBaseResponse], status_code=status.HTTP_201_CREATED)
@@ -41,13 +44,12 @@ async def create_knowledge_base(
     )
     db.add(kb)
     await db.commit()
-    await db.refresh(kb)
     return SuccessResponse(data=KnowledgeBaseResponse.model_validate(kb), message="知识库创建成功")
 
 
 @router.get("/{kb_id}", response_model=SuccessResponse[KnowledgeBaseResponse])
 async def get_knowledge_base(
-    kb_id: str,
+    kb_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -67,7 +69,7 @@ async def get_knowledge_base(
 
 @router.patch("/{kb_id}", response_model=SuccessResponse[KnowledgeBaseResponse])
 async def update_knowledge_base(
-    kb_id: str,
+    kb_id: uuid.UUID,
     kb_data: KnowledgeBaseUpdate,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
@@ -87,14 +89,15 @@ async def update_knowledge_base(
     for field, value in update_data.items():
         setattr(kb, field, value)
 
-    await db.commit()
-    await db.refresh(kb)
+    # Skip the write round-trip for an empty PATCH
+    if update_data:
+        await db.commit()
     return SuccessResponse(data=KnowledgeBaseResponse.model_validate(kb), message="知识库更新成功")
 
 
 @router.delete("/{kb_id}", response_model=SuccessResponse[dict])
 async def delete_knowledge_base(
-    kb_id: str,
+    kb_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -116,7 +119,7 @@ async def delete_knowledge_base(
 
 @router.get("/{kb_id}/cards", response_model=SuccessResponse[list[KnowledgeCardResponse]])
 async def get_knowledge_base_cards(
-    kb_id: str,
+    kb_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -139,4 +142,4 @@ async def get_knowledge_base_cards(
         .order_by(KnowledgeCard.created_at.desc())
     )
     cards = result.scalars().all()
-    return SuccessResponse(data=[KnowledgeCardResponse.model_validate(c) for c in cards])
+    return SuccessResponse(data=KnowledgeCardListAdapter.validate_python(cards))
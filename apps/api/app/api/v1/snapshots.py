@@ -7,12 +7,14 @@ from app.schemas import (
     SnapshotCreate,
     SnapshotUpdate,
     SnapshotResponse,
+    SnapshotListAdapter,
     SuccessResponse,
     PaginatedResponse,
 )
 from app.dependencies import get_current_user
 from app.utils.pagination import paginate
 from datetime import datetime
+import uuid
 
 router = APIRouter(prefix="/snapshots", tags=["snapshots"])
 
@@ -22,7 +24,7 @@ async def get_snapshots(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     status_filter: str = Query(None, alias="status"),
-    subscription_id: str = Query(None),
+    subscription_id: uuid.UUID | None = Query(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -36,7 +38,7 @@ async def get_snapshots(
     query = query.order_by(Snapshot.added_at.desc())
 
     result = await paginate(query, db, page, limit)
-    result["items"] = [SnapshotResponse.model_validate(s) for s in result["items"]]
+    result["items"] = SnapshotListAdapter.validate_python(result["items"])
 
     return SuccessResponse(data=result)
 
@@ -53,13 +55,12 @@ async def create_snapshot(
     )
     db.add(snapshot)
     await db.commit()
-    await db.refresh(snapshot)
     return SuccessResponse(data=SnapshotResponse.model_validate(snapshot), message="快照创建成功")
 
 
 @router.get("/{snapshot_id}", response_model=SuccessResponse[SnapshotResponse])
 async def get_snapshot(
-    snapshot_id: str,
+    snapshot_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -79,7 +80,7 @@ async def get_snapshot(
 
 @router.patch("/{snapshot_id}", response_model=SuccessResponse[SnapshotResponse])
 async def update_snapshot(
-    snapshot_id: str,
+    snapshot_id: uuid.UUID,
     snapshot_data: SnapshotUpdate,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
@@ -102,14 +103,15 @@ async def update_snapshot(
     if snapshot_data.status == "processed" and not snapshot.processed_at:
         snapshot.processed_at = datetime.utcnow()
 
-    await db.commit()
-    await db.refresh(snapshot)
+    # Skip the write round-trip for an empty PATCH
+    if update_data:
+        await db.commit()
     return SuccessResponse(data=SnapshotResponse.model_validate(snapshot), message="快照更新成功")
 
 
 @router.delete("/{snapshot_id}", response_model=SuccessResponse[dict])
 async def delete_snapshot(
-    snapshot_id: str,
+    snapshot_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -131,7 +133,7 @@ async def delete_snapshot(
 
 @router.post("/{snapshot_id}/generate", response_model=SuccessResponse[dict])
 async def generate_cards(
-    snapshot_id: str,
+    snapshot_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -7,11 +7,13 @@ from app.schemas import (
     SubscriptionCreate,
     SubscriptionUpdate,
     SubscriptionResponse,
+    SubscriptionListAdapter,
     SuccessResponse,
     PaginatedResponse,
 )
 from app.dependencies import get_current_user
 from app.utils.pagination import paginate
+import uuid
 
 router = APIRouter(prefix="/subscriptions", tags=["subscriptions"])
 
@@ -27,7 +29,7 @@ async def get_subscriptions(
         .order_by(Subscription.created_at.desc())
     )
     subscriptions = result.scalars().all()
-    return SuccessResponse(data=[SubscriptionResponse.model_validate(s) for s in subscriptions])
+    return SuccessResponse(data=SubscriptionListAdapter.validate_python(subscriptions))
 
 
 @router.post("", response_model=SuccessResponse[SubscriptionResponse], status_code=status.HTTP_201_CREATED)
@@ -42,13 +44,12 @@ async def create_subscription(
     )
     db.add(subscription)
     await db.commit()
-    await db.refresh(subscription)
     return SuccessResponse(data=SubscriptionResponse.model_validate(subscription), message="订阅源创建成功")
 
 
 @router.get("/{subscription_id}", response_model=SuccessResponse[SubscriptionResponse])
 async def get_subscription(
-    subscription_id: str,
+    subscription_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -68,7 +69,7 @@ async def get_subscription(
 
 @router.patch("/{subscription_id}", response_model=SuccessResponse[SubscriptionResponse])
 async def update_subscription(
-    subscription_id: str,
+    subscription_id: uuid.UUID,
     subscription_data: SubscriptionUpdate,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
@@ -88,14 +89,15 @@ async def update_subscription(
     for field, value in update_data.items():
         setattr(subscription, field, value)
 
-    await db.commit()
-    await db.refresh(subscription)
+    # Skip the write round-trip for an empty PATCH
+    if update_data:
+        await db.commit()
     return SuccessResponse(data=SubscriptionResponse.model_validate(subscription), message="订阅源更新成功")
 
 
 @router.delete("/{subscription_id}", response_model=SuccessResponse[dict])
 async def delete_subscription(
-    subscription_id: str,
+    subscription_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -117,7 +119,7 @@ async def delete_subscription(
 
 @router.post("/{subscription_id}/fetch", response_model=SuccessResponse[dict])
 async def fetch_subscription(
-    subscription_id: str,
+    subscription_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -4,7 +4,7 @@ from app.config import settings
 
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=True,
+    echo=settings.DATABASE_ECHO,
     pool_size=5,
     max_overflow=10,
     pool_recycle=3600,
@@ -4,6 +4,7 @@ from datetime import datetime
 import uuid
 import enum
 from app.database import Base
+from app.utils.ids import uuid7
 
 
 class CardTypeEnum(str, enum.Enum):
@@ -15,7 +16,7 @@ class CardTypeEnum(str, enum.Enum):
 class KnowledgeCard(Base):
     __tablename__ = "knowledge_cards"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     knowledge_base_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("knowledge_bases.id"), nullable=False, index=True)
     snapshot_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("snapshots.id"), index=True)
     card_type: Mapped[CardTypeEnum] = mapped_column(SQLEnum(CardTypeEnum), nullable=False, index=True)
@@ -4,6 +4,7 @@ from datetime import datetime
 import uuid
 import enum
 from app.database import Base
+from app.utils.ids import uuid7
 
 
 class ContentFormatEnum(str, enum.Enum):
@@ -20,7 +21,7 @@ class SnapshotStatusEnum(str, enum.Enum):
 class Snapshot(Base):
     __tablename__ = "snapshots"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     subscription_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("subscriptions.id"), index=True)
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     title: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -4,6 +4,7 @@ from datetime import datetime
 import uuid
 import enum
 from app.database import Base
+from app.utils.ids import uuid7
 
 
 class FrequencyEnum(str, enum.Enum):
@@ -15,7 +16,7 @@ class FrequencyEnum(str, enum.Enum):
 class Subscription(Base):
     __tablename__ = "subscriptions"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     url: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -4,6 +4,7 @@ from datetime import datetime
 import uuid
 import enum
 from app.database import Base
+from app.utils.ids import uuid7
 
 
 class ProgressStatusEnum(str, enum.Enum):
@@ -18,7 +19,7 @@ class UserCardProgress(Base):
         UniqueConstraint("user_id", "card_id", name="uq_user_card"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     card_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("knowledge_cards.id"), nullable=False, index=True)
     status: Mapped[ProgressStatusEnum] = mapped_column(SQLEnum(ProgressStatusEnum), default=ProgressStatusEnum.NEW)
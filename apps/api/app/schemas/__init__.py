@@ -1,9 +1,9 @@
 from app.schemas.common import SuccessResponse, ErrorResponse, PaginatedResponse
 from app.schemas.auth import UserRegister, UserLogin, TokenResponse, TokenRefresh, UserResponse
-from app.schemas.subscription import SubscriptionCreate, SubscriptionUpdate, SubscriptionResponse
-from app.schemas.snapshot import SnapshotCreate, SnapshotUpdate, SnapshotResponse
-from app.schemas.knowledge_base import KnowledgeBaseCreate, KnowledgeBaseUpdate, KnowledgeBaseResponse
-from app.schemas.knowledge_card import KnowledgeCardCreate, KnowledgeCardUpdate, KnowledgeCardResponse, CardReviewSubmit
+from app.schemas.subscription import SubscriptionCreate, SubscriptionUpdate, SubscriptionResponse, SubscriptionListAdapter
+from app.schemas.snapshot import SnapshotCreate, SnapshotUpdate, SnapshotResponse, SnapshotListAdapter
+from app.schemas.knowledge_base import KnowledgeBaseCreate, KnowledgeBaseUpdate, KnowledgeBaseResponse, KnowledgeBaseListAdapter
+from app.schemas.knowledge_card import KnowledgeCardCreate, KnowledgeCardUpdate, KnowledgeCardResponse, KnowledgeCardListAdapter, CardReviewSubmit
 from app.schemas.media import MediaResponse
 
 __all__ = [
@@ -18,15 +18,19 @@ __all__ = [
     "SubscriptionCreate",
     "SubscriptionUpdate",
     "SubscriptionResponse",
+    "SubscriptionListAdapter",
     "SnapshotCreate",
     "SnapshotUpdate",
     "SnapshotResponse",
+    "SnapshotListAdapter",
     "KnowledgeBaseCreate",
     "KnowledgeBaseUpdate",
     "KnowledgeBaseResponse",
+    "KnowledgeBaseListAdapter",
     "KnowledgeCardCreate",
     "KnowledgeCardUpdate",
     "KnowledgeCardResponse",
+    "KnowledgeCardListAdapter",
     "CardReviewSubmit",
     "MediaResponse",
 ]
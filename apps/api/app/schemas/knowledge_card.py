@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 from datetime import datetime
 import uuid
 from app.models.knowledge_card import CardTypeEnum
@@ -39,8 +39,10 @@ class KnowledgeCardResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+KnowledgeCardListAdapter = TypeAdapter(list[KnowledgeCardResponse])
 
 
 class CardReviewSubmit(BaseModel):
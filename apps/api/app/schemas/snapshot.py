@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 from datetime import datetime
 import uuid
 from app.models.snapshot import ContentFormatEnum, SnapshotStatusEnum
@@ -40,5 +40,7 @@ class SnapshotResponse(BaseModel):
     added_at: datetime
     processed_at: datetime | None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+SnapshotListAdapter = TypeAdapter(list[SnapshotResponse])
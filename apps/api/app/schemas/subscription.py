@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 from datetime import datetime
 import uuid
 from app.models.subscription import FrequencyEnum
@@ -28,5 +28,7 @@ class SubscriptionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+SubscriptionListAdapter = TypeAdapter(list[SubscriptionResponse])
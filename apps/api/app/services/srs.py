@@ -0,0 +1,65 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import case, cast, func
+from sqlalchemy.dialects.postgresql import insert
+from app.models import UserCardProgress, ProgressStatusEnum
+from datetime import datetime
+import uuid
+
+MASTERED_CORRECT_COUNT = 3
+
+
+def _status(value: ProgressStatusEnum):
+    # Bind with the column's enum type so CASE branches aren't resolved as text
+    return cast(value.name, UserCardProgress.status.type)
+
+
+async def record_review(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    card_id: uuid.UUID,
+    is_correct: bool,
+) -> UserCardProgress:
+    """记录一次复习结果 - 基于权重的简单算法"""
+    now = datetime.utcnow()
+
+    # First review starts from the default weight of 1.0
+    stmt = insert(UserCardProgress).values(
+        user_id=user_id,
+        card_id=card_id,
+        status=ProgressStatusEnum.LEARNING,
+        last_reviewed_at=now,
+        review_count=1,
+        correct_count=1 if is_correct else 0,
+        weight=0.8 if is_correct else 1.5,
+    )
+
+    # Subsequent reviews update the existing row in the same statement
+    if is_correct:
+        updates = {
+            "correct_count": UserCardProgress.correct_count + 1,
+            "weight": func.greatest(0.1, UserCardProgress.weight * 0.8),  # Decrease weight for correct answers
+            "status": case(
+                (UserCardProgress.correct_count + 1 >= MASTERED_CORRECT_COUNT, _status(ProgressStatusEnum.MASTERED)),
+                else_=_status(ProgressStatusEnum.LEARNING),
+            ),
+        }
+    else:
+        updates = {
+            "weight": func.least(2.0, UserCardProgress.weight * 1.5),  # Increase weight for incorrect answers
+            "status": _status(ProgressStatusEnum.LEARNING),
+        }
+
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UserCardProgress.user_id, UserCardProgress.card_id],
+        set_={
+            "review_count": UserCardProgress.review_count + 1,
+            "last_reviewed_at": now,
+            **updates,
+        },
+    ).returning(UserCardProgress)
+
+    result = await db.execute(stmt, execution_options={"populate_existing": True})
+    progress = result.scalar_one()
+
+    await db.commit()
+    return progress
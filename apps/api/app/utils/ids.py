@@ -0,0 +1,15 @@
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    # RFC 9562 UUIDv7: 48-bit Unix ms timestamp followed by random bits, so new
+    # primary keys land at the right edge of the B-tree index
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+
+    # Set version (7) and variant (0b10) bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)